@@ -0,0 +1,16 @@
+from django.core.cache import cache
+
+POSTS_CACHE_VERSION_KEY = 'blog:posts:version'
+
+
+def get_posts_cache_version():
+    """Текущая версия кеша страниц со списками постов."""
+    return cache.get_or_set(POSTS_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def bump_posts_cache_version():
+    """Сбрасываем кеш списков постов, меняя его версию."""
+    try:
+        cache.incr(POSTS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(POSTS_CACHE_VERSION_KEY, 1, timeout=None)
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.1 on 2026-10-15 08:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_comment_ordering_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_pub_pubdate_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_category_pubdate_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_author_pubdate_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-pub_date', '-id'], name='post_pub_pubdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-pub_date', '-id'], name='post_category_pubdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-pub_date', '-id'], name='post_author_pubdate_idx'),
+        ),
+    ]
@@ -1,6 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
 from django.contrib.auth import get_user_model
 
+from .cache import bump_posts_cache_version
+
 User = get_user_model()
 
 MAX_LENGTH_MODELS = 256
@@ -51,6 +55,11 @@ class Category(BaseModel):
     class Meta:
         verbose_name = 'категория'
         verbose_name_plural = 'Категории'
+        indexes = [
+            models.Index(
+                fields=('is_published', 'slug'),
+                name='category_pub_slug_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -88,17 +97,81 @@ class Post(BaseModel):
         blank=True,
         upload_to='blog_images'
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
         default_related_name = 'posts'
+        indexes = [
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_pub_pubdate_idx'),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                name='post_category_pubdate_idx'),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_pubdate_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
 
+def change_comment_count(post_id, delta):
+    """Изменяем счётчик комментариев поста на delta одним UPDATE."""
+    if post_id is not None:
+        Post.objects.filter(pk=post_id).update(
+            comment_count=Greatest(F('comment_count') + delta, 0))
+
+
+# Признак того, что прежний post_id комментария не загружался.
+NOT_LOADED = object()
+
+
+class CommentQuerySet(models.QuerySet):
+
+    def delete(self):
+        """Удаляем комментарии и уменьшаем счётчики их постов."""
+        with transaction.atomic():
+            counts = dict(
+                self.order_by().values_list('post_id').annotate(Count('pk')))
+            result = super().delete()
+            for post_id, total in counts.items():
+                change_comment_count(post_id, -total)
+        bump_posts_cache_version()
+        return result
+
+    def update(self, **kwargs):
+        """
+        При переносе комментариев в другой пост (post/post_id в kwargs)
+        пересчитываем счётчики прежних постов и нового поста.
+        Значение поста должно быть объектом Post, его id или None;
+        выражения (F() и т. п.) не поддерживаются.
+        """
+        if 'post' not in kwargs and 'post_id' not in kwargs:
+            return super().update(**kwargs)
+        new_post = kwargs.get('post', kwargs.get('post_id'))
+        new_post_id = getattr(new_post, 'pk', new_post)
+        with transaction.atomic():
+            counts = dict(
+                self.order_by().values_list('post_id').annotate(Count('pk')))
+            result = super().update(**kwargs)
+            for post_id, total in counts.items():
+                change_comment_count(post_id, -total)
+            change_comment_count(new_post_id, sum(counts.values()))
+        bump_posts_cache_version()
+        return result
+
+
 class Comment(models.Model):
     author = models.ForeignKey(
         User, on_delete=models.CASCADE, null=True,
@@ -120,6 +193,63 @@ class Comment(models.Model):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        ordering = ('created_at',)
+        indexes = [
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_idx'),
+        ]
+
+    objects = CommentQuerySet.as_manager()
 
     def __str__(self):
         return self.text
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'post_id' in instance.__dict__:
+            instance._loaded_post_id = instance.post_id
+        return instance
+
+    def _get_old_post_id(self):
+        """
+        Пост, к которому комментарий привязан в базе. Если post_id был
+        отложен (only/defer) и не менялся, save() его не записывает,
+        и возвращается NOT_LOADED — счётчики трогать не нужно.
+        """
+        if hasattr(self, '_loaded_post_id'):
+            return self._loaded_post_id
+        if 'post_id' not in self.__dict__:
+            return NOT_LOADED
+        return Comment.objects.filter(pk=self.pk).values_list(
+            'post_id', flat=True).first()
+
+    def save(self, *args, **kwargs):
+        """
+        Счётчик комментариев поддерживается здесь, а не сигналами:
+        обработчики удаления на Comment отключили бы быстрое
+        каскадное удаление комментариев вместе с постом.
+        """
+        adding = self._state.adding
+        with transaction.atomic():
+            old_post_id = None if adding else self._get_old_post_id()
+            super().save(*args, **kwargs)
+            if adding:
+                change_comment_count(self.post_id, 1)
+            elif (
+                old_post_id is not NOT_LOADED
+                and old_post_id != self.post_id
+            ):
+                change_comment_count(old_post_id, -1)
+                change_comment_count(self.post_id, 1)
+        if 'post_id' in self.__dict__:
+            self._loaded_post_id = self.post_id
+
+    def delete(self, *args, **kwargs):
+        post_id = self.post_id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            change_comment_count(post_id, -1)
+        bump_posts_cache_version()
+        return result
@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import bump_posts_cache_version
+from .models import Category, Comment, Location, Post, User
+
+
+@receiver(pre_delete, sender=User)
+def delete_user_comments(sender, instance, **kwargs):
+    """
+    Комментарии пользователя удаляем до каскада,
+    чтобы уменьшить счётчики чужих постов.
+    """
+    Comment.objects.filter(author=instance).delete()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=User)
+def reset_posts_cache(sender, **kwargs):
+    """
+    Сбрасываем кеш списков постов при изменении их содержимого.
+
+    Удаление комментариев сбрасывает кеш в Comment.delete()
+    и CommentQuerySet.delete().
+    """
+    bump_posts_cache_version()
+
+
+@receiver(post_save, sender=User)
+def reset_posts_cache_on_user_change(sender, update_fields=None, **kwargs):
+    """
+    Вход в систему сохраняет только last_login, который в карточках
+    постов не выводится, поэтому кеш в этом случае не сбрасываем.
+    """
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    bump_posts_cache_version()
@@ -0,0 +1,297 @@
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.signals import setting_changed
+from django.db.models import Q
+from django.db.models.functions import Left
+from django.dispatch import receiver
+from django.http import Http404
+from django.shortcuts import redirect
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils import timezone
+from django.views.decorators.cache import cache_page
+
+from .cache import get_posts_cache_version
+from .models import Post
+
+
+# Поля, которые нужны карточке поста в списках.
+POST_CARD_FIELDS = (
+    'id',
+    'title',
+    'pub_date',
+    'image',
+    'is_published',
+    'author__username',
+    'category__slug',
+    'category__title',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+    'comment_count',
+)
+
+# Карточке нужны первые слова текста, а не весь текст поста.
+POST_CARD_TEXT_LENGTH = 300
+
+_BASE_QS = Post.objects.select_related('author', 'category', 'location')
+_POST_CARD_QS = _BASE_QS.only(*POST_CARD_FIELDS).annotate(
+    text_preview=Left('text', POST_CARD_TEXT_LENGTH)
+).order_by('-pub_date', '-id')
+_PUBLIC_FILTER = Q(is_published=True) & Q(category__is_published=True)
+
+POSTS_CACHE_TIMEOUT = 60
+
+# Наибольшее значение BigAutoField.
+MAX_POST_ID = 2 ** 63 - 1
+
+
+@lru_cache(maxsize=32)
+def _post_detail_template(script_prefix, urlconf):
+    """
+    Шаблон адреса страницы поста для данного префикса и urlconf.
+
+    Префикс и urlconf входят в ключ кеша, поэтому разные SCRIPT_NAME
+    и request.urlconf получают свои шаблоны. При смене ROOT_URLCONF
+    (например, override_settings в тестах) кеш очищается.
+    """
+    prefix, suffix = reverse(
+        'blog:post_detail', urlconf=urlconf, kwargs={'post_id': 0}
+    ).rsplit('0', 1)
+    return prefix + '{}' + suffix
+
+
+@receiver(setting_changed)
+def clear_post_detail_template(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _post_detail_template.cache_clear()
+
+
+def post_detail_url(post_id):
+    """Адрес страницы поста без обхода URL resolver на каждый запрос."""
+    return _post_detail_template(
+        get_script_prefix(), get_urlconf()).format(post_id)
+
+
+class OnlyAuthorMixin(UserPassesTestMixin):
+    """Mixin для проверки прав автора."""
+
+    def get_object(self, queryset=None):
+        """
+        Объект запрашивается из базы один раз за запрос и переиспользуется
+        при проверке прав и в обработчиках get()/post().
+        """
+        if not hasattr(self, '_obj'):
+            self._obj = super().get_object(queryset)
+        return self._obj
+
+    def test_func(self):
+        """Сравниваем только ключи, не загружая автора из базы."""
+        user = self.request.user
+
+        return (
+            user.is_authenticated
+            and self.get_object().author_id == user.pk
+        )
+
+    def handle_no_permission(self):
+        """Определяем поведение в зависимости от типа ошибки."""
+        return redirect(post_detail_url(self.kwargs['post_id']))
+
+
+def base_posts_qs():
+    """Посты вместе с автором, категорией и местоположением."""
+    return _BASE_QS.all()
+
+
+def posts_qs():
+    """Все посты для карточек в списках, от новых к старым."""
+    return _POST_CARD_QS.all()
+
+
+def published_posts_qs():
+    """Опубликованные посты для карточек в списках."""
+    return _POST_CARD_QS.filter(_PUBLIC_FILTER, pub_date__lte=timezone.now())
+
+
+def iter_published_posts(batch=500):
+    """
+    Итерирует по всем опубликованным постам пачками по batch штук.
+
+    Длительные обработчики (команды, выгрузки) должны использовать эту
+    функцию вместо list(...): результаты не попадают в кеш QuerySet,
+    и в памяти одновременно держится не больше одной пачки.
+    Посты загружаются целиком, без проекции карточки, чтобы чтение
+    post.text не делало отдельный запрос на каждую строку.
+    """
+    return _BASE_QS.filter(
+        _PUBLIC_FILTER, pub_date__lte=timezone.now()
+    ).order_by('-pub_date', '-id').iterator(chunk_size=batch)
+
+
+def encode_cursor(post):
+    """Курсор вида <pub_date в ISO>_<id>, указывающий на пост."""
+    return f'{post.pub_date.isoformat()}_{post.id}'
+
+
+def decode_cursor(cursor):
+    """
+    Разбираем курсор, при ошибке отдаём 404 как на неверной странице.
+
+    Дата приводится к UTC, чтобы значения у границ диапазона datetime
+    отсеивались здесь, а не падали при построении SQL-запроса.
+    """
+    try:
+        pub_date, post_id = cursor.rsplit('_', 1)
+        pub_date = datetime.fromisoformat(pub_date)
+        if timezone.is_naive(pub_date):
+            pub_date = timezone.make_aware(pub_date)
+        pub_date = pub_date.astimezone(dt_timezone.utc)
+        post_id = int(post_id)
+        if not 0 < post_id <= MAX_POST_ID:
+            raise ValueError('post_id вне допустимого диапазона')
+        return pub_date, post_id
+    except (ValueError, OverflowError):
+        raise Http404('Страница не найдена')
+
+
+class KeysetPage:
+    """Страница постов, полученная по курсору."""
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next and self.object_list:
+            return encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous and self.object_list:
+            return encode_cursor(self.object_list[0])
+
+
+class KeysetPaginator:
+    """
+    Пагинатор по курсору (pub_date, id).
+
+    Вместо LIMIT/OFFSET выбирает посты строго после курсора after
+    (следующая страница) или строго перед курсором before (предыдущая),
+    поэтому стоимость любой страницы не зависит от её глубины,
+    а COUNT(*) по всей выборке не нужен.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def page(self, after=None, before=None):
+        if before is not None and after is None:
+            return self._page_before(before)
+        queryset = self.queryset
+        if after is not None:
+            pub_date, post_id = decode_cursor(after)
+            queryset = queryset.filter(
+                Q(pub_date__lt=pub_date)
+                | Q(pub_date=pub_date, id__lt=post_id)
+            )
+        posts = list(
+            queryset.order_by('-pub_date', '-id')[:self.per_page + 1])
+        return KeysetPage(
+            posts[:self.per_page],
+            has_next=len(posts) > self.per_page,
+            has_previous=after is not None,
+        )
+
+    def _page_before(self, before):
+        """
+        Та же выборка в обратном порядке: берём посты новее курсора
+        по возрастанию и разворачиваем их.
+        """
+        pub_date, post_id = decode_cursor(before)
+        posts = list(self.queryset.filter(
+            Q(pub_date__gt=pub_date)
+            | Q(pub_date=pub_date, id__gt=post_id)
+        ).order_by('pub_date', 'id')[:self.per_page + 1])
+        return KeysetPage(
+            posts[:self.per_page][::-1],
+            has_next=True,
+            has_previous=len(posts) > self.per_page,
+        )
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin для ListView: страницы строятся по курсорам ?after=<курсор>
+    (вперёд) и ?before=<курсор> (назад), первая страница — без курсора.
+    Обычная постраничная пагинация с OFFSET и COUNT(*) остаётся только
+    для явных ссылок вида ?page=N.
+    """
+
+    cursor_kwarg = 'after'
+    before_cursor_kwarg = 'before'
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.request.GET.get(self.page_kwarg) is not None:
+            paginator, page, object_list, is_paginated = (
+                super().paginate_queryset(queryset, page_size))
+            page.object_list = list(page.object_list)
+            page.next_cursor = (
+                encode_cursor(page.object_list[-1])
+                if page.has_next() else None
+            )
+            page.previous_cursor = (
+                encode_cursor(page.object_list[0])
+                if page.has_previous() else None
+            )
+            return paginator, page, page.object_list, is_paginated
+        paginator = KeysetPaginator(queryset, page_size)
+        page = paginator.page(
+            after=self.request.GET.get(self.cursor_kwarg),
+            before=self.request.GET.get(self.before_cursor_kwarg),
+        )
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class AnonymousCachePageMixin:
+    """
+    Mixin кеширует страницу целиком для анонимных пользователей.
+
+    Версия кеша входит в ключ и меняется при изменении постов,
+    комментариев, категорий, местоположений и пользователей.
+
+    CACHES в настройках не задан, поэтому используется LocMemCache,
+    свой у каждого процесса: версия меняется только в процессе,
+    который обработал запись. Остальные воркеры могут отдавать
+    устаревшую страницу до истечения cache_timeout. Чтобы сброс
+    был общим, нужен разделяемый кеш (Redis, Memcached).
+    """
+
+    cache_timeout = POSTS_CACHE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        return cache_page(
+            self.cache_timeout,
+            key_prefix=f'blog:posts:{get_posts_cache_version()}'
+        )(super().dispatch)(request, *args, **kwargs)
@@ -1,73 +1,33 @@
 from django.http import Http404
 from django.views.generic import (
     ListView, CreateView, UpdateView, DeleteView, DetailView)
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.urls import reverse_lazy, reverse
-from django.db.models import Count
-from django.contrib.auth.mixins import UserPassesTestMixin
+from django.db.models import Prefetch
 
 from .models import Post, Comment, Category
 from .forms import PostForm, UserProfileForm, CommentForm
+from .utils import (
+    AnonymousCachePageMixin, KeysetPaginationMixin, OnlyAuthorMixin,
+    base_posts_qs, post_detail_url, posts_qs, published_posts_qs)
 
 
 VALUE_POSTS_PAGINATE = 10
 
 
-class OnlyAuthorMixin(UserPassesTestMixin):
-    """Mixin для проверки прав автора."""
-
-    def test_func(self):
-        object = self.get_object()
-        user = self.request.user
-
-        return object.author == user
-
-    def handle_no_permission(self):
-        """Определяем поведение в зависимости от типа ошибки."""
-        return redirect(reverse(
-            'blog:post_detail', kwargs={'post_id': self.kwargs['post_id']}
-        ))
-
-
-def queryset_pattern(
-        add_filter=False, add_comments=False):
-    queryset = Post.objects.select_related(
-        'author',
-        'category',
-        'location'
-    )
-
-    """
-    Функция является шаблоном для получения QuerySet,
-    в зависимости от требований.
-    """
-    if add_filter:
-        # Добавление фильтров.
-        queryset = queryset.filter(
-            is_published=True,
-            pub_date__lte=timezone.now(),
-            category__is_published=True,
-        )
-
-    if add_comments:
-        # Добавления комментариев.
-        queryset = queryset.annotate(
-            comment_count=Count('comments')).order_by('-pub_date')
-    return queryset
-
-
-class PostListView(ListView):
+class PostListView(
+        AnonymousCachePageMixin, KeysetPaginationMixin, ListView):
     """Главная страница с постами."""
 
     paginate_by = VALUE_POSTS_PAGINATE
     template_name = 'blog/index.html'
 
     def get_queryset(self):
-        return queryset_pattern(
-            add_filter=True, add_comments=True)
+        return published_posts_qs()
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -94,8 +54,7 @@ class PostUpdateView(OnlyAuthorMixin, UpdateView):
     pk_url_kwarg = 'post_id'
 
     def get_success_url(self):
-        post_id = self.kwargs.get('post_id')
-        return reverse('blog:post_detail', kwargs={'post_id': post_id})
+        return post_detail_url(self.kwargs.get('post_id'))
 
 
 class PostDetailView(DetailView):
@@ -104,51 +63,63 @@ class PostDetailView(DetailView):
     model = Post
     template_name = 'blog/detail.html'
 
+    def get_queryset(self):
+        """
+        Пост загружается вместе со связанными объектами и комментариями,
+        чтобы шаблон не делал дополнительных запросов к базе.
+        """
+        return base_posts_qs().prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author')
+            )
+        )
+
     def get_object(self, queryset=None):
         """
         Функция гарантирует, что страницу поста смогут видеть либо его автор,
         либо любой пользователь, если пост опубликован.
         """
+        if hasattr(self, '_cached_object'):
+            return self._cached_object
         post_id = self.kwargs.get('post_id')
-        post = get_object_or_404(Post, id=post_id)
+        post = get_object_or_404(self.get_queryset(), id=post_id)
         if post.author != self.request.user and (
             not post.is_published or not post.category.is_published
             or not post.pub_date <= timezone.now()
         ):
             raise Http404('Страница не найдена')
+        self._cached_object = post
         return post
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        post = self.get_object()
         context['form'] = CommentForm()
-        context['comments'] = post.comments.all().select_related(
-            'author').order_by('created_at')
+        context['comments'] = self.object.comments.all()
         return context
 
 
-class CategoryPostsView(ListView):
+class CategoryPostsView(
+        AnonymousCachePageMixin, KeysetPaginationMixin, ListView):
     """Посты по категориям."""
 
     model = Post
     template_name = 'blog/category.html'
     paginate_by = VALUE_POSTS_PAGINATE
 
-    def get_object_category(self):
-        """Функция получает объект категории."""
-        category = get_object_or_404(
+    @cached_property
+    def category(self):
+        """Получаем объект категории."""
+        return get_object_or_404(
             Category, slug=self.kwargs['category_slug'], is_published=True
         )
-        return category
 
     def get_queryset(self):
-        return queryset_pattern(
-            add_comments=True,
-            add_filter=True).filter(category=self.get_object_category())
+        return published_posts_qs().filter(category=self.category)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['category'] = self.get_object_category()
+        context['category'] = self.category
         return context
 
 
@@ -161,37 +132,44 @@ class PostDeleteView(OnlyAuthorMixin, DeleteView):
     pk_url_kwarg = 'post_id'
 
 
-class ProfileView(ListView):
+class ProfileView(KeysetPaginationMixin, ListView):
     """Страница профиля."""
 
     model = Post
     template_name = 'blog/profile.html'
     paginate_by = VALUE_POSTS_PAGINATE
 
-    def get_profile_object(self):
+    @cached_property
+    def is_owner(self):
+        """Владелец профиля определяется по имени, без запроса к базе."""
+        user = self.request.user
+        return (
+            user.is_authenticated
+            and user.username == self.kwargs['username']
+        )
+
+    @cached_property
+    def profile(self):
         """Получаем объект профиля."""
-        profile = get_object_or_404(
+        if self.is_owner:
+            return self.request.user
+        return get_object_or_404(
             User, username=self.kwargs['username'])
-        return profile
 
     def get_queryset(self):
         """
         Выводим фильтрацию в зависимости от того,
         является ли пользователь владельцем профиля.
         """
-        if self.request.user == self.get_profile_object():
-            queryset = queryset_pattern(add_comments=True).filter(
-                author=self.get_profile_object())
+        if self.is_owner:
+            queryset = posts_qs().filter(author=self.profile)
         else:
-            queryset = queryset_pattern(
-                add_comments=True,
-                add_filter=True
-            ).filter(author=self.get_profile_object())
+            queryset = published_posts_qs().filter(author=self.profile)
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = self.get_profile_object()
+        context['profile'] = self.profile
         return context
 
 
@@ -227,54 +205,52 @@ class AddCommentView(LoginRequiredMixin, CreateView):
         После успешного действия, перенаправляем пользователя
         на страницу этого поста.
         """
-        post_id = self.kwargs.get('post_id')
-        return reverse('blog:post_detail', kwargs={'post_id': post_id})
+        return post_detail_url(self.kwargs.get('post_id'))
 
     def form_valid(self, form):
         post_id = self.kwargs.get('post_id')
-        post = get_object_or_404(Post, id=post_id)
-        form.instance.post = post
+        if not Post.objects.filter(pk=post_id).exists():
+            raise Http404('Страница не найдена')
+        form.instance.post_id = post_id
         form.instance.author = self.request.user
         return super().form_valid(form)
 
 
-class EditCommentView(OnlyAuthorMixin, UpdateView):
-    """Редактирование комментария."""
+class CommentMixin(OnlyAuthorMixin):
+    """Mixin для редактирования и удаления комментария."""
 
     model = Comment
-    form_class = CommentForm
     template_name = 'blog/comment.html'
+    pk_url_kwarg = 'comment_id'
 
-    def get_object(self, queryset=None):
-        comment_id = self.kwargs.get('comment_id')
-        post_id = self.kwargs.get('post_id')
-        return get_object_or_404(Comment, id=comment_id, post_id=post_id)
+    def get_queryset(self):
+        """
+        Комментарий загружается вместе с автором и постом одним запросом,
+        который переиспользуется проверкой прав и шаблоном.
+        """
+        return Comment.objects.select_related('author', 'post').filter(
+            post_id=self.kwargs.get('post_id'))
+
+
+class EditCommentView(CommentMixin, UpdateView):
+    """Редактирование комментария."""
+
+    form_class = CommentForm
 
     def get_success_url(self):
         """
         После успешного действия, перенаправляем пользователя
         на страницу этого поста.
         """
-        post_id = self.kwargs.get('post_id')
-        return reverse('blog:post_detail', kwargs={'post_id': post_id})
+        return post_detail_url(self.kwargs.get('post_id'))
 
 
-class DeleteCommentView(OnlyAuthorMixin, DeleteView):
+class DeleteCommentView(CommentMixin, DeleteView):
     """Удаление комментария."""
 
-    model = Comment
-    template_name = 'blog/comment.html'
-    pk_url_kwarg = 'comment_id'
-
-    def get_object(self, queryset=None):
-        comment_id = self.kwargs.get('comment_id')
-        post_id = self.kwargs.get('post_id')
-        return get_object_or_404(Comment, id=comment_id, post_id=post_id)
-
     def get_success_url(self):
         """
         После успешного действия, перенаправляем пользователя
         на страницу этого поста.
         """
-        post_id = self.kwargs.get('post_id')
-        return reverse_lazy('blog:post_detail', kwargs={'post_id': post_id})
+        return post_detail_url(self.kwargs.get('post_id'))
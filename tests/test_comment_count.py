@@ -0,0 +1,164 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from mixer.backend.django import Mixer
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def two_posts(mixer: Mixer, user, published_category):
+    return mixer.cycle(2).blend(
+        "blog.Post", author=user, category=published_category,
+        comment_count=0,
+    )
+
+
+def comment_count(post: Post) -> int:
+    post.refresh_from_db(fields=["comment_count"])
+    return post.comment_count
+
+
+def test_comment_count_on_create_and_delete(user, two_posts):
+    post, _ = two_posts
+    comments = [
+        Comment.objects.create(post=post, author=user, text=str(i))
+        for i in range(3)
+    ]
+    assert comment_count(post) == 3, (
+        "Убедитесь, что при создании комментария счётчик комментариев"
+        " поста увеличивается."
+    )
+
+    comments[0].delete()
+    assert comment_count(post) == 2, (
+        "Убедитесь, что при удалении комментария счётчик комментариев"
+        " поста уменьшается."
+    )
+
+    Comment.objects.filter(post=post).delete()
+    assert comment_count(post) == 0, (
+        "Убедитесь, что при удалении комментариев через QuerySet счётчик"
+        " комментариев поста уменьшается."
+    )
+
+
+def test_comment_count_on_move(user, two_posts):
+    old_post, new_post = two_posts
+    comment = Comment.objects.create(post=old_post, author=user, text="a")
+
+    comment = Comment.objects.get(pk=comment.pk)
+    comment.post = new_post
+    comment.save()
+
+    assert comment_count(old_post) == 0, (
+        "Убедитесь, что при переносе комментария в другой пост счётчик"
+        " прежнего поста уменьшается."
+    )
+    assert comment_count(new_post) == 1, (
+        "Убедитесь, что при переносе комментария в другой пост счётчик"
+        " нового поста увеличивается."
+    )
+
+
+def test_comment_count_on_edit(user, two_posts):
+    post, _ = two_posts
+    comment = Comment.objects.create(post=post, author=user, text="a")
+
+    comment = Comment.objects.get(pk=comment.pk)
+    comment.text = "b"
+    comment.save()
+
+    assert comment_count(post) == 1, (
+        "Убедитесь, что редактирование комментария не меняет счётчик"
+        " комментариев поста."
+    )
+
+
+def test_comment_count_on_save_with_deferred_post(user, two_posts):
+    post, _ = two_posts
+    Comment.objects.create(post=post, author=user, text="a")
+
+    comment = Comment.objects.only("text").get()
+    comment.text = "b"
+    comment.save()
+
+    assert comment_count(post) == 1, (
+        "Убедитесь, что сохранение комментария с отложенным полем поста"
+        " не меняет счётчик комментариев."
+    )
+
+
+def test_comment_count_on_move_with_deferred_post(user, two_posts):
+    old_post, new_post = two_posts
+    Comment.objects.create(post=old_post, author=user, text="a")
+
+    comment = Comment.objects.only("text").get()
+    comment.post = new_post
+    comment.save()
+
+    assert (comment_count(old_post), comment_count(new_post)) == (0, 1), (
+        "Убедитесь, что перенос комментария с отложенным полем поста"
+        " пересчитывает счётчики обоих постов."
+    )
+
+
+def test_comment_count_on_queryset_update(user, two_posts):
+    old_post, new_post = two_posts
+    for i in range(2):
+        Comment.objects.create(post=old_post, author=user, text=str(i))
+
+    Comment.objects.filter(post=old_post).update(post=new_post)
+
+    assert (comment_count(old_post), comment_count(new_post)) == (0, 2), (
+        "Убедитесь, что перенос комментариев через QuerySet.update()"
+        " пересчитывает счётчики постов."
+    )
+
+
+def test_delete_post_with_comments(
+        user, two_posts, django_assert_max_num_queries):
+    post, _ = two_posts
+    for i in range(50):
+        Comment.objects.create(post=post, author=user, text=str(i))
+
+    with django_assert_max_num_queries(10):
+        post.delete()
+
+    assert not Comment.objects.exists(), (
+        "Убедитесь, что комментарии удаляются вместе с постом."
+    )
+
+
+def test_delete_user_with_comments(another_user, two_posts):
+    post, _ = two_posts
+    Comment.objects.create(post=post, author=another_user, text="a")
+
+    another_user.delete()
+
+    assert comment_count(post) == 0, (
+        "Убедитесь, что при удалении автора комментариев счётчик"
+        " комментариев поста уменьшается."
+    )
+
+
+def test_backfill_comment_count(user, two_posts):
+    post_with_comments, post_without_comments = two_posts
+    for i in range(2):
+        Comment.objects.create(
+            post=post_with_comments, author=user, text=str(i))
+    Post.objects.update(comment_count=7)
+
+    call_command("backfill_comment_count", stdout=StringIO())
+
+    assert comment_count(post_with_comments) == 2, (
+        "Убедитесь, что команда backfill_comment_count записывает"
+        " число комментариев поста."
+    )
+    assert comment_count(post_without_comments) == 0, (
+        "Убедитесь, что команда backfill_comment_count обнуляет счётчик"
+        " у постов без комментариев."
+    )
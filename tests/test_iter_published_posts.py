@@ -0,0 +1,29 @@
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from blog.utils import iter_published_posts
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def published_posts(mixer: Mixer, user, published_category):
+    return mixer.cycle(25).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timezone.timedelta(days=1),
+    )
+
+
+def test_iter_published_posts_reads_text_without_extra_queries(
+        published_posts, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        texts = [post.text for post in iter_published_posts(batch=100)]
+
+    assert len(texts) == len(published_posts), (
+        "Убедитесь, что iter_published_posts() возвращает все"
+        " опубликованные посты."
+    )
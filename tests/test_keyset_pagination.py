@@ -0,0 +1,114 @@
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def posts_with_same_pub_date(mixer: Mixer, user, published_category):
+    pub_date = timezone.now() - timezone.timedelta(days=1)
+    return mixer.cycle(N_PER_PAGE * 2 + 5).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_date,
+    )
+
+
+@pytest.mark.parametrize("url", ["/", "/profile/{username}/"])
+def test_cursor_walk_has_no_duplicates_or_gaps(
+        user_client, user, posts_with_same_pub_date, url):
+    url = url.format(username=user.username)
+    seen_ids = []
+    params = {}
+    for _ in range(len(posts_with_same_pub_date)):
+        response = user_client.get(url, params)
+        assert response.status_code == HTTPStatus.OK
+        page_obj = response.context["page_obj"]
+        seen_ids.extend(post.id for post in page_obj)
+        if not page_obj.has_next():
+            break
+        params = {"after": page_obj.next_cursor}
+
+    assert len(seen_ids) == len(set(seen_ids)), (
+        "Убедитесь, что при переходе по курсору посты не повторяются."
+    )
+    assert set(seen_ids) == {post.id for post in posts_with_same_pub_date}, (
+        "Убедитесь, что при переходе по курсору не пропускаются посты."
+    )
+
+
+def test_cursor_pages_flags(user_client, posts_with_same_pub_date):
+    first = user_client.get("/").context["page_obj"]
+    assert not first.has_previous()
+    assert first.has_next()
+
+    page_obj = first
+    while page_obj.has_next():
+        page_obj = user_client.get(
+            "/", {"after": page_obj.next_cursor}).context["page_obj"]
+    assert page_obj.has_previous()
+    assert not page_obj.has_next()
+
+
+def test_cursor_walk_back_matches_walk_forward(
+        user_client, posts_with_same_pub_date):
+    forward_pages = []
+    params = {}
+    while True:
+        page_obj = user_client.get("/", params).context["page_obj"]
+        forward_pages.append([post.id for post in page_obj])
+        if not page_obj.has_next():
+            break
+        params = {"after": page_obj.next_cursor}
+
+    response = user_client.get("/", params)
+    assert "?before=" in response.content.decode(), (
+        "Убедитесь, что на страницах после первой есть ссылка"
+        " на предыдущую страницу."
+    )
+
+    backward_pages = [forward_pages[-1]]
+    page_obj = response.context["page_obj"]
+    while page_obj.has_previous():
+        page_obj = user_client.get(
+            "/", {"before": page_obj.previous_cursor}).context["page_obj"]
+        backward_pages.append([post.id for post in page_obj])
+
+    assert backward_pages[::-1] == forward_pages, (
+        "Убедитесь, что при переходе назад по курсору before страницы"
+        " совпадают со страницами, пройденными вперёд."
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "garbage",
+        "2024-01-01T00:00:00",
+        "not-a-date_5",
+        "_",
+        "9999-12-31T23:59:59-23:00_5",
+        "0001-01-01T00:00:00+14:00_1",
+        "2024-01-01T00:00:00+00:00_" + "9" * 30,
+    ],
+)
+@pytest.mark.parametrize("direction", ["after", "before"])
+def test_malformed_cursor_returns_404(user_client, cursor, direction):
+    response = user_client.get("/", {direction: cursor})
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что при неверном курсоре возвращается страница 404."
+    )
+
+
+def test_naive_cursor_is_treated_as_utc(user_client):
+    response = user_client.get("/", {"after": "2024-01-01T00:00:00_1"})
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что курсор без часового пояса принимается как UTC."
+    )
@@ -0,0 +1,29 @@
+from django.test import override_settings
+from django.urls import include, path, set_script_prefix
+
+from blog.utils import post_detail_url
+
+urlpatterns = [
+    path("prefixed/", include("blog.urls")),
+]
+
+
+def test_post_detail_url_follows_script_prefix():
+    assert post_detail_url(5) == "/posts/5/"
+    set_script_prefix("/blogicum/")
+    try:
+        assert post_detail_url(5) == "/blogicum/posts/5/", (
+            "Убедитесь, что адрес поста учитывает SCRIPT_NAME."
+        )
+    finally:
+        set_script_prefix("/")
+    assert post_detail_url(5) == "/posts/5/"
+
+
+def test_post_detail_url_follows_root_urlconf():
+    assert post_detail_url(7) == "/posts/7/"
+    with override_settings(ROOT_URLCONF=__name__):
+        assert post_detail_url(7) == "/prefixed/posts/7/", (
+            "Убедитесь, что адрес поста учитывает смену ROOT_URLCONF."
+        )
+    assert post_detail_url(7) == "/posts/7/"
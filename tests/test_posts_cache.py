@@ -0,0 +1,76 @@
+import pytest
+from django.core.cache import cache
+from django.test import Client
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from blog.cache import get_posts_cache_version
+from blog.models import Comment
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def published_post(mixer: Mixer, user, published_category):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timezone.timedelta(days=1),
+        title="Первый заголовок",
+        comment_count=0,
+    )
+
+
+def test_anonymous_index_is_cached(
+        unlogged_client, published_post, django_assert_num_queries):
+    unlogged_client.get("/")
+    with django_assert_num_queries(0):
+        unlogged_client.get("/")
+
+
+def test_post_save_invalidates_anonymous_index(
+        unlogged_client, published_post):
+    assert "Первый заголовок" in unlogged_client.get("/").content.decode()
+
+    published_post.title = "Второй заголовок"
+    published_post.save()
+
+    content = unlogged_client.get("/").content.decode()
+    assert "Второй заголовок" in content, (
+        "Убедитесь, что после сохранения поста кеш главной страницы"
+        " для анонимных пользователей сбрасывается."
+    )
+
+
+def test_comment_save_invalidates_anonymous_index(
+        unlogged_client, user, published_post):
+    assert "Комментарии (0)" in unlogged_client.get("/").content.decode()
+
+    Comment.objects.create(post=published_post, author=user, text="a")
+
+    content = unlogged_client.get("/").content.decode()
+    assert "Комментарии (1)" in content, (
+        "Убедитесь, что после добавления комментария кеш главной страницы"
+        " для анонимных пользователей сбрасывается."
+    )
+
+
+def test_login_keeps_anonymous_cache(user, published_post):
+    user.set_password("password")
+    user.save()
+    version = get_posts_cache_version()
+
+    Client().login(username=user.username, password="password")
+
+    assert get_posts_cache_version() == version, (
+        "Убедитесь, что вход пользователя не сбрасывает кеш списков постов."
+    )